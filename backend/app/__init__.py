@@ -16,6 +16,12 @@ def create_app():
     app.config['JWT_SECRET_KEY'] = os.environ.get('JWT_SECRET_KEY', 'jwt-dev-key')
     app.config['MONGO_URI'] = os.environ.get('MONGO_URI', 'mongodb://localhost:27017/social_assistant')
     
+    # Retention settings for hot/cold tiering of posts and interactions
+    app.config['POST_RETENTION_LIMIT'] = int(os.environ.get('POST_RETENTION_LIMIT', 100))
+    app.config['INTERACTION_RETENTION_DAYS'] = int(os.environ.get('INTERACTION_RETENTION_DAYS', 90))
+    app.config['REJECTED_POST_TTL_DAYS'] = int(os.environ.get('REJECTED_POST_TTL_DAYS', 30))
+    app.config['RETENTION_BATCH_SIZE'] = int(os.environ.get('RETENTION_BATCH_SIZE', 500))
+    
     # Initialize extensions
     jwt = JWTManager(app)
     
@@ -30,4 +36,22 @@ def create_app():
     from app.routes.stats import stats_bp
     app.register_blueprint(stats_bp, url_prefix='/api/stats')
     
+    # Add dashboard endpoint
+    from app.routes.dashboard import dashboard_bp
+    app.register_blueprint(dashboard_bp, url_prefix='/api/dashboard')
+    
+    # Add retention command (run periodically, e.g. from cron: flask retention)
+    @app.cli.command('retention')
+    def retention_command():
+        from app.services.retention import run_retention
+        print(run_retention())
+    
+    # Add command to move inline long post bodies into post_bodies
+    @app.cli.command('migrate-post-bodies')
+    def migrate_post_bodies_command():
+        from app.models import Post
+        from app.services.retention import ensure_indexes
+        ensure_indexes()
+        print({'postBodiesMigrated': Post.migrate_long_bodies(app.config['RETENTION_BATCH_SIZE'])})
+    
     return app
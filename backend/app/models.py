@@ -1,14 +1,74 @@
 from flask import current_app
-from pymongo import MongoClient
+from pymongo import MongoClient, DeleteOne, ReplaceOne, ReturnDocument
+from bson import Binary, decode as bson_decode, encode as bson_encode
 from werkzeug.security import generate_password_hash, check_password_hash
 import datetime
 import uuid
+import zlib
 
 # MongoDB connection
 def get_db():
     client = MongoClient(current_app.config['MONGO_URI'])
     return client.get_database()
 
+# Archive helpers
+# Archived documents keep their lookup keys in the clear and store the full
+# original document as zlib-compressed BSON under 'data'.
+def _compress_document(doc, envelope):
+    original = {k: v for k, v in doc.items() if k != '_id'}
+    archived = envelope(doc)
+    archived['archivedAt'] = datetime.datetime.utcnow()
+    archived['data'] = Binary(zlib.compress(bson_encode(original)))
+    return archived
+
+def _decompress_document(archived):
+    if not archived:
+        return None
+    return bson_decode(zlib.decompress(archived['data']))
+
+# Long-form post bodies live in post_bodies as zlib-compressed text, keyed
+# by postId, and are only loaded when a caller asks for them
+def _compress_text(text):
+    return Binary(zlib.compress(text.encode('utf-8')))
+
+def _decompress_text(data):
+    return zlib.decompress(data).decode('utf-8')
+
+def _merge_archived(hot_docs, archived_docs, skip, limit):
+    # Merge hot documents with archived envelopes by createdAt (newest first)
+    # and only decompress the archived documents that make it into the page
+    merged = [(doc, False) for doc in hot_docs] + [(doc, True) for doc in archived_docs]
+    merged.sort(key=lambda item: item[0]['createdAt'], reverse=True)
+    
+    return [
+        _decompress_document(doc) if archived else doc
+        for doc, archived in merged[skip:skip + limit]
+    ]
+
+def _archive_documents(hot, archive, id_field, docs, envelope, state):
+    if not docs:
+        return 0
+    
+    # Upsert into the archive first so an interrupted run never loses data
+    archive.bulk_write([
+        ReplaceOne({id_field: doc[id_field]}, _compress_document(doc, envelope), upsert=True)
+        for doc in docs
+    ], ordered=False)
+    
+    # Only delete hot documents still in the snapshotted state; anything
+    # written to since the batch was read stays hot for the next run
+    result = hot.bulk_write([
+        DeleteOne({id_field: doc[id_field], **state(doc)})
+        for doc in docs
+    ], ordered=False)
+    
+    # Drop the stale archive copies of documents that stayed hot
+    if result.deleted_count < len(docs):
+        ids = [doc[id_field] for doc in docs]
+        archive.delete_many({id_field: {'$in': hot.distinct(id_field, {id_field: {'$in': ids}})}})
+    
+    return result.deleted_count
+
 # User model
 class User:
     @staticmethod
@@ -56,6 +116,20 @@ class User:
         )
         return result.modified_count > 0
 
+# Post state machine: target status -> statuses it may be reached from
+POST_TRANSITIONS = {
+    'Approved': ['Pending'],
+    'Rejected': ['Pending'],
+    'Posted': ['Approved']
+}
+
+# Only posts that no longer need any action are moved to the archive
+ARCHIVABLE_POST_STATUSES = ['Posted', 'Rejected']
+
+# Fields left out of post reads unless the long form is requested. Posts
+# written before post_bodies existed still embed content.long until migrated.
+POST_SUMMARY_PROJECTION = {'content.long': False}
+
 # Post model
 class Post:
     @staticmethod
@@ -66,7 +140,7 @@ class Post:
         post = {
             'postId': post_id,
             'userId': user_id,
-            'content': content,  # {micro, short, long}
+            'content': {k: v for k, v in content.items() if k != 'long'},  # {micro, short}
             'imageUrl': image_url,
             'status': 'Pending',
             'platform': None,
@@ -74,13 +148,58 @@ class Post:
             'postedAt': None
         }
         
-        db.posts.insert_one(post)
+        # Write the body first so a post is never visible without one, and
+        # remove it again if the post itself can't be stored
+        db.post_bodies.insert_one({
+            'postId': post_id,
+            'long': _compress_text(content['long'])
+        })
+        
+        try:
+            db.posts.insert_one(post)
+        except Exception:
+            db.post_bodies.delete_one({'postId': post_id})
+            raise
+        
         return post_id
     
     @staticmethod
-    def find_by_id(post_id):
+    def find_by_id(post_id, include_long=False, include_archived=True):
+        db = get_db()
+        post = db.posts.find_one({'postId': post_id}, None if include_long else POST_SUMMARY_PROJECTION)
+        
+        # Fall back to the archive for posts moved out of the hot collection
+        if not post:
+            if not include_archived:
+                return None
+            post = _decompress_document(db.posts_archive.find_one({'postId': post_id}))
+            if not post:
+                return None
+        
+        if include_long:
+            post['content']['long'] = Post.find_long(post)
+        else:
+            post['content'].pop('long', None)
+        
+        return post
+    
+    @staticmethod
+    def find_archived(post_id):
         db = get_db()
-        return db.posts.find_one({'postId': post_id})
+        post = _decompress_document(db.posts_archive.find_one({'postId': post_id}))
+        if post:
+            post['content'].pop('long', None)
+        return post
+    
+    @staticmethod
+    def find_long(post):
+        # Legacy posts still carry the long body inline
+        if 'long' in post['content']:
+            return post['content']['long']
+        
+        db = get_db()
+        body = db.post_bodies.find_one({'postId': post['postId']})
+        return _decompress_text(body['long']) if body else None
     
     @staticmethod
     def find_by_user_id(user_id, status=None, limit=100):
@@ -90,12 +209,36 @@ class Post:
         if status and status != 'All':
             query['status'] = status
             
-        return list(db.posts.find(query).sort('createdAt', -1).limit(limit))
+        posts = list(db.posts.find(query, POST_SUMMARY_PROJECTION).sort('createdAt', -1).limit(limit))
+        
+        # Continue into the archive when the hot collection comes up short
+        if len(posts) < limit and query.get('status') in [None, *ARCHIVABLE_POST_STATUSES]:
+            archived = list(db.posts_archive.find(query).sort('createdAt', -1).limit(limit))
+            posts = _merge_archived(posts, archived, 0, limit)
+            for post in posts:
+                post.pop('_id', None)
+                post['content'].pop('long', None)
+        
+        return posts
     
     @staticmethod
-    def find_recent_by_user_id(user_id, limit=100):
+    def count_by_user_id(user_id, status=None):
         db = get_db()
-        return list(db.posts.find({'userId': user_id}).sort('createdAt', -1).limit(limit))
+        query = {'userId': user_id}
+        
+        if status and status != 'All':
+            query['status'] = status
+        
+        total = db.posts.count_documents(query)
+        if query.get('status') in [None, *ARCHIVABLE_POST_STATUSES]:
+            total += db.posts_archive.count_documents(query)
+        
+        return total
+    
+    @staticmethod
+    def find_recent_by_user_id(user_id, limit=100, projection=POST_SUMMARY_PROJECTION):
+        db = get_db()
+        return list(db.posts.find({'userId': user_id}, projection).sort('createdAt', -1).limit(limit))
     
     @staticmethod
     def update_status(post_id, status):
@@ -107,6 +250,8 @@ class Post:
         
         if status == 'Posted':
             updates['postedAt'] = datetime.datetime.utcnow()
+        elif status == 'Rejected':
+            updates['rejectedAt'] = datetime.datetime.utcnow()
         
         result = db.posts.update_one(
             {'postId': post_id},
@@ -114,6 +259,108 @@ class Post:
         )
         
         return result.modified_count > 0
+    
+    @staticmethod
+    def transition(post_id, user_id, status):
+        # Ownership, existence and the allowed source status are all checked by
+        # one conditional update, so concurrent transitions can't both succeed.
+        # Returns the updated post, or None if the transition was not applied.
+        db = get_db()
+        
+        updates = {
+            'status': status
+        }
+        
+        if status == 'Posted':
+            updates['postedAt'] = datetime.datetime.utcnow()
+        elif status == 'Rejected':
+            updates['rejectedAt'] = datetime.datetime.utcnow()
+        
+        return db.posts.find_one_and_update(
+            {'postId': post_id, 'userId': user_id, 'status': {'$in': POST_TRANSITIONS[status]}},
+            {'$set': updates},
+            projection={'_id': False, **POST_SUMMARY_PROJECTION},
+            return_document=ReturnDocument.AFTER
+        )
+    
+    @staticmethod
+    def archive(posts):
+        db = get_db()
+        return _archive_documents(
+            db.posts, db.posts_archive, 'postId', posts,
+            lambda post: {
+                'postId': post['postId'],
+                'userId': post['userId'],
+                'status': post['status'],
+                'createdAt': post['createdAt'],
+                'rejectedAt': post.get('rejectedAt')
+            },
+            lambda post: {'status': post['status']}
+        )
+    
+    @staticmethod
+    def delete_rejected_before(cutoff):
+        db = get_db()
+        
+        # Posts rejected before rejectedAt was recorded fall back to createdAt
+        query = {'status': 'Rejected', '$or': [
+            {'rejectedAt': {'$lt': cutoff}},
+            {'rejectedAt': None, 'createdAt': {'$lt': cutoff}}
+        ]}
+        
+        post_ids = db.posts.distinct('postId', query) + db.posts_archive.distinct('postId', query)
+        if not post_ids:
+            return 0
+        
+        deleted = db.posts.delete_many(query).deleted_count
+        deleted += db.posts_archive.delete_many(query).deleted_count
+        
+        # Remove everything that hangs off the deleted posts
+        db.post_bodies.delete_many({'postId': {'$in': post_ids}})
+        db.interactions.delete_many({'postId': {'$in': post_ids}})
+        db.interactions_archive.delete_many({'postId': {'$in': post_ids}})
+        
+        return deleted
+    
+    @staticmethod
+    def migrate_long_bodies(batch_size=500):
+        # Move inline content.long from legacy posts into post_bodies. Safe to
+        # re-run: bodies are upserted and only still-inline posts are touched.
+        # Batches walk the _id index from where the previous one stopped, so
+        # the collection is scanned once rather than once per batch.
+        db = get_db()
+        migrated = 0
+        last_id = None
+        
+        while True:
+            query = {'content.long': {'$exists': True}}
+            if last_id is not None:
+                query['_id'] = {'$gt': last_id}
+            
+            batch = list(db.posts.find(
+                query,
+                {'postId': True, 'content.long': True}
+            ).sort('_id', 1).limit(batch_size))
+            if not batch:
+                break
+            last_id = batch[-1]['_id']
+            
+            db.post_bodies.bulk_write([
+                ReplaceOne(
+                    {'postId': post['postId']},
+                    {'postId': post['postId'], 'long': _compress_text(post['content']['long'])},
+                    upsert=True
+                )
+                for post in batch
+            ], ordered=False)
+            
+            result = db.posts.update_many(
+                {'postId': {'$in': [post['postId'] for post in batch]}},
+                {'$unset': {'content.long': ''}}
+            )
+            migrated += result.modified_count
+        
+        return migrated
 
 # Interaction model
 class Interaction:
@@ -144,23 +391,43 @@ class Interaction:
     @staticmethod
     def find_by_id(interaction_id):
         db = get_db()
-        return db.interactions.find_one({'interactionId': interaction_id})
+        interaction = db.interactions.find_one({'interactionId': interaction_id})
+        if interaction:
+            return interaction
+        
+        # Fall back to the archive for interactions moved out of the hot collection
+        return _decompress_document(db.interactions_archive.find_one({'interactionId': interaction_id}))
     
     @staticmethod
     def find_by_user_id(user_id, page=1, limit=10):
         db = get_db()
         skip = (page - 1) * limit
         
-        cursor = db.interactions.find({'userId': user_id}).sort('createdAt', -1).skip(skip).limit(limit)
-        total = db.interactions.count_documents({'userId': user_id})
+        hot_total = db.interactions.count_documents({'userId': user_id})
+        archived_total = db.interactions_archive.count_documents({'userId': user_id})
+        
+        if archived_total:
+            # Unanswered interactions stay hot regardless of age, so the two
+            # collections overlap in time; merge their leading pages by date
+            hot = db.interactions.find({'userId': user_id}).sort('createdAt', -1).limit(skip + limit)
+            archived = db.interactions_archive.find({'userId': user_id}).sort('createdAt', -1).limit(skip + limit)
+            items = _merge_archived(list(hot), list(archived), skip, limit)
+        else:
+            items = list(db.interactions.find({'userId': user_id}).sort('createdAt', -1).skip(skip).limit(limit))
         
         return {
-            'items': list(cursor),
-            'total': total,
+            'items': items,
+            'total': hot_total + archived_total,
             'page': page,
             'limit': limit
         }
     
+    @staticmethod
+    def count_by_user_id(user_id):
+        db = get_db()
+        total = db.interactions.count_documents({'userId': user_id})
+        return total + db.interactions_archive.count_documents({'userId': user_id})
+    
     @staticmethod
     def find_recent_by_user_id(user_id, limit=5):
         db = get_db()
@@ -180,12 +447,31 @@ class Interaction:
         
         return result.modified_count > 0
     
+    @staticmethod
+    def archive(interactions):
+        db = get_db()
+        return _archive_documents(
+            db.interactions, db.interactions_archive, 'interactionId', interactions,
+            lambda interaction: {
+                'interactionId': interaction['interactionId'],
+                'postId': interaction['postId'],
+                'userId': interaction['userId'],
+                'responded': interaction.get('response') is not None,
+                'createdAt': interaction['createdAt']
+            },
+            lambda interaction: {'response': interaction.get('response')}
+        )
+    
     @staticmethod
     def get_stats(user_id):
         db = get_db()
         
         total = db.interactions.count_documents({'userId': user_id})
         responded = db.interactions.count_documents({'userId': user_id, 'response': {'$ne': None}})
+        
+        # Include archived interactions so totals don't drop after a retention run
+        total += db.interactions_archive.count_documents({'userId': user_id})
+        responded += db.interactions_archive.count_documents({'userId': user_id, 'responded': True})
         pending = total - responded
         
         return {
@@ -0,0 +1,50 @@
+from flask import Blueprint, request, jsonify, current_app
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from concurrent.futures import ThreadPoolExecutor
+from app.models import Post, Interaction
+
+dashboard_bp = Blueprint('dashboard', __name__)
+
+# Shared pool for the dashboard fan-out; each request runs five queries
+executor = ThreadPoolExecutor(max_workers=20)
+
+# Inclusion projection with only the post fields the dashboard renders
+DASHBOARD_POST_FIELDS = {'_id': False, 'postId': True, 'status': True, 'createdAt': True, 'content.micro': True}
+
+@dashboard_bp.route('', methods=['GET'])
+@jwt_required()
+def get_dashboard():
+    user_id = get_jwt_identity()
+    
+    # Get query parameters
+    limit = int(request.args.get('limit', 5))
+    
+    # Run the queries concurrently; total time is bounded by the slowest one
+    app = current_app._get_current_object()
+    
+    def run(func, *args, **kwargs):
+        with app.app_context():
+            return func(*args, **kwargs)
+    
+    pending_posts = executor.submit(run, Post.count_by_user_id, user_id, 'Pending')
+    active_posts = executor.submit(run, Post.count_by_user_id, user_id, 'Posted')
+    interaction_count = executor.submit(run, Interaction.count_by_user_id, user_id)
+    posts = executor.submit(run, Post.find_recent_by_user_id, user_id, limit, DASHBOARD_POST_FIELDS)
+    interactions = executor.submit(run, Interaction.find_recent_by_user_id, user_id, limit)
+    
+    recent_interactions = interactions.result()
+    
+    # Convert MongoDB ObjectId to string for JSON serialization
+    for interaction in recent_interactions:
+        if '_id' in interaction:
+            del interaction['_id']
+    
+    return jsonify({
+        'stats': {
+            'pendingPosts': pending_posts.result(),
+            'activePosts': active_posts.result(),
+            'interactions': interaction_count.result()
+        },
+        'recentPosts': posts.result(),
+        'recentInteractions': recent_interactions
+    }), 200
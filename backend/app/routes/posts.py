@@ -30,8 +30,8 @@ def get_posts():
 def get_post(post_id):
     user_id = get_jwt_identity()
     
-    # Get post from database
-    post = Post.find_by_id(post_id)
+    # Get post from database, including the long-form body
+    post = Post.find_by_id(post_id, include_long=True)
     if not post:
         return jsonify({'message': 'Post not found'}), 404
     
@@ -74,19 +74,10 @@ def generate_post():
 def approve_post(post_id):
     user_id = get_jwt_identity()
     
-    # Get post from database
-    post = Post.find_by_id(post_id)
+    # Approve the post if it exists, belongs to the user and is still pending
+    post = Post.transition(post_id, user_id, 'Approved')
     if not post:
-        return jsonify({'message': 'Post not found'}), 404
-    
-    # Verify post belongs to user
-    if post['userId'] != user_id:
-        return jsonify({'message': 'Unauthorized'}), 403
-    
-    # Update post status
-    success = Post.update_status(post_id, 'Approved')
-    if not success:
-        return jsonify({'message': 'Failed to approve post'}), 400
+        return transition_error(post_id, user_id, 'Failed to approve post')
     
     # Post to social media platforms (async)
     try:
@@ -94,7 +85,7 @@ def approve_post(post_id):
         post_to_platforms(post)
         
         # Update post status to Posted
-        Post.update_status(post_id, 'Posted')
+        Post.transition(post_id, user_id, 'Posted')
     except Exception as e:
         # Log error but don't fail the request
         print(f"Error posting to social media: {str(e)}")
@@ -106,18 +97,29 @@ def approve_post(post_id):
 def reject_post(post_id):
     user_id = get_jwt_identity()
     
-    # Get post from database
-    post = Post.find_by_id(post_id)
+    # Reject the post if it exists, belongs to the user and is still pending
+    post = Post.transition(post_id, user_id, 'Rejected')
+    if not post:
+        return transition_error(post_id, user_id, 'Failed to reject post')
+    
+    return jsonify({'message': 'Post rejected'}), 200
+
+def transition_error(post_id, user_id, message):
+    # Only reached when a transition was refused; look the post up to report why.
+    # Transitions only apply to the hot collection, so archived posts are
+    # reported as such rather than by their (possibly stale) status.
+    post = Post.find_by_id(post_id, include_archived=False)
+    archived = post is None
+    if archived:
+        post = Post.find_archived(post_id)
+    
     if not post:
         return jsonify({'message': 'Post not found'}), 404
     
-    # Verify post belongs to user
     if post['userId'] != user_id:
         return jsonify({'message': 'Unauthorized'}), 403
     
-    # Update post status
-    success = Post.update_status(post_id, 'Rejected')
-    if not success:
-        return jsonify({'message': 'Failed to reject post'}), 400
+    if archived:
+        return jsonify({'message': f'{message}: post is archived'}), 409
     
-    return jsonify({'message': 'Post rejected'}), 200
+    return jsonify({'message': f"{message}: post is {post['status']}"}), 409
@@ -9,15 +9,11 @@ stats_bp = Blueprint('stats', __name__)
 def get_stats():
     user_id = get_jwt_identity()
     
-    # Get posts stats
-    pending_posts = len(Post.find_by_user_id(user_id, 'Pending'))
-    active_posts = len(Post.find_by_user_id(user_id, 'Posted'))
-    
-    # Get interactions stats
-    interaction_stats = Interaction.get_stats(user_id)
-    
-    return jsonify({
-        'pendingPosts': pending_posts,
-        'activePosts': active_posts,
-        'interactions': interaction_stats['total']
-    }), 200
+    return jsonify(compute_stats(user_id)), 200
+
+def compute_stats(user_id):
+    return {
+        'pendingPosts': Post.count_by_user_id(user_id, 'Pending'),
+        'activePosts': Post.count_by_user_id(user_id, 'Posted'),
+        'interactions': Interaction.count_by_user_id(user_id)
+    }
@@ -0,0 +1,75 @@
+from flask import current_app
+from app.models import get_db, Post, Interaction, ARCHIVABLE_POST_STATUSES
+import datetime
+
+# Hot/cold retention for posts and interactions.
+# The hot collections keep only what the app actively reads; older documents
+# are moved in batches to compressed archive collections (see app.models).
+def run_retention():
+    config = current_app.config
+    ensure_indexes()
+    
+    return {
+        'rejectedPostsDeleted': expire_rejected_posts(config['REJECTED_POST_TTL_DAYS']),
+        'postsArchived': archive_old_posts(config['POST_RETENTION_LIMIT'], config['RETENTION_BATCH_SIZE']),
+        'interactionsArchived': archive_old_interactions(
+            config['INTERACTION_RETENTION_DAYS'],
+            config['RETENTION_BATCH_SIZE']
+        ),
+        'postBodiesMigrated': Post.migrate_long_bodies(config['RETENTION_BATCH_SIZE'])
+    }
+
+def ensure_indexes():
+    db = get_db()
+    db.posts_archive.create_index('postId', unique=True)
+    db.posts_archive.create_index([('userId', 1), ('createdAt', -1)])
+    db.interactions_archive.create_index('interactionId', unique=True)
+    db.interactions_archive.create_index([('userId', 1), ('createdAt', -1)])
+    db.post_bodies.create_index('postId', unique=True)
+
+def expire_rejected_posts(ttl_days):
+    # A TTL of 0 or less keeps rejected posts forever
+    if ttl_days <= 0:
+        return 0
+    
+    cutoff = datetime.datetime.utcnow() - datetime.timedelta(days=ttl_days)
+    return Post.delete_rejected_before(cutoff)
+
+def archive_old_posts(keep_per_user, batch_size):
+    db = get_db()
+    archived = 0
+    
+    # Keep each user's most recent finished posts hot and archive everything
+    # older. Pending and Approved posts still need action, so they stay hot.
+    for user_id in db.posts.distinct('userId'):
+        while True:
+            batch = list(
+                db.posts.find({'userId': user_id, 'status': {'$in': ARCHIVABLE_POST_STATUSES}})
+                .sort('createdAt', -1)
+                .skip(keep_per_user)
+                .limit(batch_size)
+            )
+            moved = Post.archive(batch)
+            if not moved:
+                break
+            archived += moved
+    
+    return archived
+
+def archive_old_interactions(retention_days, batch_size):
+    db = get_db()
+    archived = 0
+    cutoff = datetime.datetime.utcnow() - datetime.timedelta(days=retention_days)
+    
+    # Unanswered interactions stay hot so they can still be responded to
+    while True:
+        batch = list(db.interactions.find({
+            'createdAt': {'$lt': cutoff},
+            'response': {'$ne': None}
+        }).limit(batch_size))
+        moved = Interaction.archive(batch)
+        if not moved:
+            break
+        archived += moved
+    
+    return archived
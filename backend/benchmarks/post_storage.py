@@ -0,0 +1,109 @@
+"""Compare the inline and post_bodies storage formats for posts.
+
+Usage: python benchmarks/post_storage.py [num_posts]
+
+Reports BSON storage size for both formats and, if MongoDB is reachable at
+MONGO_URI, list and detail read throughput against a scratch database.
+"""
+import os
+import sys
+import time
+import uuid
+import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bson import encode as bson_encode
+from pymongo import MongoClient
+from app.models import POST_SUMMARY_PROJECTION, _compress_text, _decompress_text
+from app.services.content_generator import generate_post_content
+
+USER = {'topics': ['technology', 'marketing', 'climate'], 'purpose': 'share insights', 'tone': 'professional'}
+
+def make_posts(count):
+    posts = []
+    for _ in range(count):
+        content, image_url = generate_post_content(USER)
+        posts.append({
+            'postId': str(uuid.uuid4()),
+            'userId': 'bench-user',
+            'content': content,
+            'imageUrl': image_url,
+            'status': 'Pending',
+            'platform': None,
+            'createdAt': datetime.datetime.utcnow(),
+            'postedAt': None
+        })
+    return posts
+
+def split_posts(posts):
+    # Same layout Post.create writes: summary document plus compressed body
+    summaries, bodies = [], []
+    for post in posts:
+        summary = dict(post, content={k: v for k, v in post['content'].items() if k != 'long'})
+        summaries.append(summary)
+        bodies.append({'postId': post['postId'], 'long': _compress_text(post['content']['long'])})
+    return summaries, bodies
+
+def report_storage(posts, summaries, bodies):
+    inline = sum(len(bson_encode(post)) for post in posts)
+    summary = sum(len(bson_encode(doc)) for doc in summaries)
+    body = sum(len(bson_encode(doc)) for doc in bodies)
+    
+    print(f"Storage for {len(posts)} posts")
+    print(f"  inline:       {inline:>10} bytes")
+    print(f"  split:        {summary + body:>10} bytes ({summary} posts + {body} post_bodies)")
+    print(f"  posts shrink: {inline / summary:.1f}x")
+
+def timed(label, count, func):
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {count / elapsed:>8.0f} ops/s")
+
+def report_reads(posts, summaries, bodies, rounds=200):
+    client = MongoClient(os.environ.get('MONGO_URI', 'mongodb://localhost:27017/social_assistant'),
+                         serverSelectionTimeoutMS=2000)
+    db = client['social_assistant_bench']
+    
+    try:
+        db.command('ping')
+    except Exception as e:
+        print(f"Skipping read benchmark, MongoDB unavailable: {e}")
+        return
+    
+    try:
+        db.inline_posts.insert_many([dict(post) for post in posts])
+        db.posts.insert_many([dict(doc) for doc in summaries])
+        db.post_bodies.insert_many([dict(doc) for doc in bodies])
+        for collection in (db.inline_posts, db.posts, db.post_bodies):
+            collection.create_index('postId')
+        db.inline_posts.create_index([('userId', 1), ('createdAt', -1)])
+        db.posts.create_index([('userId', 1), ('createdAt', -1)])
+        
+        post_id = posts[len(posts) // 2]['postId']
+        
+        def list_query(collection, projection=None):
+            return lambda: list(collection.find({'userId': 'bench-user'}, projection).sort('createdAt', -1).limit(100))
+        
+        def split_detail():
+            post = db.posts.find_one({'postId': post_id})
+            post['content']['long'] = _decompress_text(db.post_bodies.find_one({'postId': post_id})['long'])
+        
+        print(f"Read throughput ({rounds} rounds)")
+        timed('list (inline)', rounds, list_query(db.inline_posts))
+        timed('list (inline, projected)', rounds, list_query(db.inline_posts, POST_SUMMARY_PROJECTION))
+        timed('list (split)', rounds, list_query(db.posts))
+        timed('detail (inline)', rounds, lambda: db.inline_posts.find_one({'postId': post_id}))
+        timed('detail (split)', rounds, split_detail)
+    finally:
+        client.drop_database('social_assistant_bench')
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    posts = make_posts(count)
+    summaries, bodies = split_posts(posts)
+    
+    report_storage(posts, summaries, bodies)
+    report_reads(posts, summaries, bodies)
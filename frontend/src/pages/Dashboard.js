@@ -27,19 +27,19 @@ const Dashboard = () => {
   const [recentInteractions, setRecentInteractions] = useState([]);
   const [loading, setLoading] = useState(true);
 
+  // Fetch stats, recent posts, and interactions in one request
+  const loadDashboard = async () => {
+    const res = await axios.get('/api/dashboard?limit=5');
+
+    setStats(res.data.stats);
+    setRecentPosts(res.data.recentPosts);
+    setRecentInteractions(res.data.recentInteractions);
+  };
+
   useEffect(() => {
     const fetchDashboardData = async () => {
       try {
-        // Fetch stats, recent posts, and interactions in parallel
-        const [statsRes, postsRes, interactionsRes] = await Promise.all([
-          axios.get('/api/stats'),
-          axios.get('/api/posts?limit=5'),
-          axios.get('/api/interactions?limit=5')
-        ]);
-
-        setStats(statsRes.data);
-        setRecentPosts(postsRes.data);
-        setRecentInteractions(interactionsRes.data);
+        await loadDashboard();
       } catch (error) {
         console.error('Error fetching dashboard data:', error);
       } finally {
@@ -53,9 +53,8 @@ const Dashboard = () => {
   const generateNewPost = async () => {
     try {
       await axios.post('/api/posts/generate');
-      // Refresh the posts list
-      const postsRes = await axios.get('/api/posts?limit=5');
-      setRecentPosts(postsRes.data);
+      // Refresh stats and the recent posts list
+      await loadDashboard();
     } catch (error) {
       console.error('Error generating post:', error);
     }
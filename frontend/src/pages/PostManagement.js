@@ -131,9 +131,20 @@ const PostManagement = () => {
     }
   };
 
-  const handleViewDetails = (post) => {
-    setPostDetails(post);
-    setOpenDialog(true);
+  const handleViewDetails = async (post) => {
+    try {
+      // The list omits the long-form body, so load the full post
+      const response = await axios.get(`/api/posts/${post.postId}`);
+      setPostDetails(response.data);
+      setOpenDialog(true);
+    } catch (error) {
+      console.error('Error fetching post details:', error);
+      setNotification({
+        open: true,
+        message: 'Failed to load post details. Please try again.',
+        severity: 'error'
+      });
+    }
   };
 
   const handleCloseDialog = () => {